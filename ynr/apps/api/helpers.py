@@ -1,7 +1,74 @@
-from rest_framework import pagination
+import hashlib
+
+from django.core.exceptions import FieldError
+from django.db.models import Max
+from django.utils.http import http_date, quote_etag
+from rest_framework import pagination, status
+from rest_framework.response import Response
 
 
 class DefaultPageNumberPagination(pagination.PageNumberPagination):
     page_size = 10
     page_size_query_param = "page_size"
     max_page_size = 200
+
+
+class ConditionalGetMixin:
+    """
+    Add HTTP conditional GET support to a read-only ViewSet.
+
+    The ETag and Last-Modified headers are derived from the most recent
+    timestamp in the ViewSet's queryset, which costs a single MAX()
+    query. When a client re-polls with a matching If-None-Match header we
+    return 304 without running the full queryset or serializer.
+
+    Set `condition_timestamp_field` on the ViewSet if the model's
+    last-changed column isn't called "modified". Models without such a
+    column just don't get conditional responses.
+    """
+
+    condition_timestamp_field = "modified"
+
+    def get_condition_timestamp(self):
+        try:
+            return self.get_queryset().aggregate(
+                latest=Max(self.condition_timestamp_field)
+            )["latest"]
+        except FieldError:
+            return None
+
+    def conditional_response_headers(self, request):
+        timestamp = self.get_condition_timestamp()
+        if timestamp is None:
+            return {}
+        # Include the full path so each page of a paginated list gets its
+        # own ETag
+        etag = quote_etag(
+            hashlib.md5(
+                "{}-{}".format(
+                    request.get_full_path(), timestamp.isoformat()
+                ).encode("utf8")
+            ).hexdigest()
+        )
+        return {
+            "ETag": etag,
+            "Last-Modified": http_date(timestamp.timestamp()),
+        }
+
+    def conditional_get(self, request, view_method, *args, **kwargs):
+        headers = self.conditional_response_headers(request)
+        etag = headers.get("ETag")
+        if etag and request.META.get("HTTP_IF_NONE_MATCH") == etag:
+            return Response(
+                status=status.HTTP_304_NOT_MODIFIED, headers=headers
+            )
+        response = view_method(request, *args, **kwargs)
+        for header, value in headers.items():
+            response[header] = value
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional_get(request, super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional_get(request, super().retrieve, *args, **kwargs)
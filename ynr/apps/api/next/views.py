@@ -2,6 +2,7 @@ from datetime import date, datetime
 
 import api.next.serializers
 import candidates.api.next.serializers
+from api.helpers import ConditionalGetMixin
 from candidates import models as extra_models
 from candidates.filters import LoggedActionAPIFilter
 from popolo.api.next.filters import OrganizationFilter
@@ -25,7 +26,7 @@ class ResultsSetPagination(pagination.PageNumberPagination):
     max_page_size = 100
 
 
-class OrganizationViewSet(viewsets.ReadOnlyModelViewSet):
+class OrganizationViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     queryset = (
         Organization.objects.all()
         .order_by("slug")
@@ -37,7 +38,8 @@ class OrganizationViewSet(viewsets.ReadOnlyModelViewSet):
     filterset_class = OrganizationFilter
 
 
-class LoggedActionViewSet(viewsets.ReadOnlyModelViewSet):
+class LoggedActionViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
+    condition_timestamp_field = "updated"
     queryset = extra_models.LoggedAction.objects.order_by("id")
     serializer_class = candidates.api.next.serializers.LoggedActionSerializer
     pagination_class = ResultsSetPagination
@@ -122,6 +122,30 @@ class TestAPI(
         parties_resp = self.app.get("/api/next/parties/")
         self.assertEqual(parties_resp.status_code, 200)
 
+    def test_conditional_get(self):
+        response = self.app.get("/api/next/organizations/")
+        etag = response.headers["ETag"]
+        self.assertTrue(etag)
+        self.assertIn("Last-Modified", response.headers)
+
+        # Replaying the ETag short-circuits to an empty 304
+        response = self.app.get(
+            "/api/next/organizations/",
+            headers={"If-None-Match": etag},
+            status=304,
+        )
+        self.assertEqual(response.body, b"")
+        self.assertEqual(response.headers["ETag"], etag)
+
+        # Saving an organization bumps its modified timestamp, so the
+        # stale ETag no longer matches and a new one is issued
+        self.commons.save()
+        response = self.app.get(
+            "/api/next/organizations/", headers={"If-None-Match": etag}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers["ETag"], etag)
+
     def test_party_endpoint(self):
         parties_resp = self.app.get("/api/next/parties/")
         self.assertEqual(parties_resp.json["count"], 7)
@@ -127,6 +127,28 @@ class TestAPI(
         posts_resp = self.app.get("/api/v0.9/posts/")
         self.assertEqual(posts_resp.status_code, 200)
 
+    def test_conditional_get(self):
+        response = self.app.get("/api/v0.9/persons/")
+        etag = response.headers["ETag"]
+        self.assertTrue(etag)
+        self.assertIn("Last-Modified", response.headers)
+
+        # Replaying the ETag short-circuits to an empty 304
+        response = self.app.get(
+            "/api/v0.9/persons/", headers={"If-None-Match": etag}, status=304
+        )
+        self.assertEqual(response.body, b"")
+        self.assertEqual(response.headers["ETag"], etag)
+
+        # Saving a person bumps their modified timestamp, so the stale
+        # ETag no longer matches and a new one is issued
+        self.person.save()
+        response = self.app.get(
+            "/api/v0.9/persons/", headers={"If-None-Match": etag}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers["ETag"], etag)
+
     def test_api_home(self):
         response = self.app.get("/api/")
         self.assertEqual(response.status_code, 302)
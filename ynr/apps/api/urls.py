@@ -130,7 +130,7 @@ urlpatterns = [
     # Standard Django views
     re_path(
         r"^api/current-elections",
-        v09views.CurrentElectionsView.as_view(),
+        cache_page(60)(v09views.CurrentElectionsView.as_view()),
         name="current-elections",
     ),
     re_path(
@@ -140,10 +140,15 @@ urlpatterns = [
         ),
         name="all-parties-json-view",
     ),
-    re_path(r"^version.json", v09views.VersionView.as_view(), name="version"),
+    re_path(
+        r"^version.json",
+        # Only changes on deploy
+        cache_page(60 * 60)(v09views.VersionView.as_view()),
+        name="version",
+    ),
     re_path(
         r"^upcoming-elections",
-        v09views.UpcomingElectionsView.as_view(),
+        cache_page(60)(v09views.UpcomingElectionsView.as_view()),
         name="upcoming-elections",
     ),
     re_path("api/slack-hooks", slack_hooks.SlackHookRouter.as_view()),
@@ -6,7 +6,7 @@ from datetime import date, datetime, timedelta
 from os.path import dirname
 
 import django
-from api.helpers import DefaultPageNumberPagination
+from api.helpers import ConditionalGetMixin, DefaultPageNumberPagination
 from api.v09 import serializers
 from candidates import models as extra_models
 from dateutil import parser
@@ -203,7 +203,7 @@ class VersionView(View):
 
 
 # Now the django-rest-framework based API views:
-class PersonViewSet(viewsets.ReadOnlyModelViewSet):
+class PersonViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     def get_queryset(self):
         queryset = Person.objects.prefetch_related(
             Prefetch(
@@ -225,7 +225,7 @@ class PersonViewSet(viewsets.ReadOnlyModelViewSet):
     pagination_class = DefaultPageNumberPagination
 
 
-class OrganizationViewSet(viewsets.ReadOnlyModelViewSet):
+class OrganizationViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     queryset = Organization.objects.prefetch_related(
         "contact_details",
         "other_names",
@@ -239,7 +239,7 @@ class OrganizationViewSet(viewsets.ReadOnlyModelViewSet):
     pagination_class = DefaultPageNumberPagination
 
 
-class PostViewSet(viewsets.ReadOnlyModelViewSet):
+class PostViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     queryset = (
         Post.objects.select_related("organization", "party_set")
         .prefetch_related(
@@ -274,7 +274,7 @@ class PostViewSet(viewsets.ReadOnlyModelViewSet):
         return post
 
 
-class ElectionViewSet(viewsets.ModelViewSet):
+class ElectionViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     lookup_value_regex = r"(?!\.json$)[^/]+"
     queryset = Election.objects.order_by("id")
     lookup_field = "slug"
@@ -304,7 +304,9 @@ class PartySetViewSet(viewsets.ReadOnlyModelViewSet):
     pagination_class = DefaultPageNumberPagination
 
 
-class PostExtraElectionViewSet(viewsets.ReadOnlyModelViewSet):
+class PostExtraElectionViewSet(
+    ConditionalGetMixin, viewsets.ReadOnlyModelViewSet
+):
     queryset = extra_models.Ballot.objects.select_related(
         "election", "post"
     ).order_by("id")
@@ -312,13 +314,14 @@ class PostExtraElectionViewSet(viewsets.ReadOnlyModelViewSet):
     pagination_class = DefaultPageNumberPagination
 
 
-class MembershipViewSet(viewsets.ReadOnlyModelViewSet):
+class MembershipViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     queryset = Membership.objects.order_by("id")
     serializer_class = serializers.MembershipSerializer
     pagination_class = DefaultPageNumberPagination
 
 
-class LoggedActionViewSet(viewsets.ReadOnlyModelViewSet):
+class LoggedActionViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
+    condition_timestamp_field = "updated"
     queryset = extra_models.LoggedAction.objects.order_by("id")
     serializer_class = serializers.LoggedActionSerializer
     pagination_class = DefaultPageNumberPagination
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [("candidates", "0084_delete_usertermsagreement")]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="loggedaction",
+            index=models.Index(
+                fields=["person", "action_type", "updated"],
+                name="candidates_la_revert_check_idx",
+            ),
+        )
+    ]
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [("candidates", "0085_loggedaction_revert_check_index")]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="ballot",
+            index=models.Index(
+                condition=models.Q(candidates_locked=False),
+                fields=["election"],
+                name="ballot_unlocked_election_idx",
+            ),
+        )
+    ]
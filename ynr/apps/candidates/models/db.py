@@ -11,6 +11,8 @@ from django.utils.html import escape
 from moderation_queue.review_required_helper import (
     POST_DECISION_REVIEW_TYPES,
     REVIEW_TYPES,
+    BaseReviewRequiredDecider,
+    evaluate_review_types,
 )
 from moderation_queue.slack import post_action_to_slack
 
@@ -162,6 +164,16 @@ class LoggedAction(models.Model):
 
     objects = LoggedActionQuerySet.as_manager()
 
+    class Meta:
+        indexes = [
+            # Covers the RevertedEdits review check, which filters on
+            # person, action_type and a recent `updated` range.
+            models.Index(
+                fields=["person", "action_type", "updated"],
+                name="candidates_la_revert_check_idx",
+            )
+        ]
+
     def __str__(self):
         username = None
         if self.user:
@@ -227,17 +239,15 @@ class LoggedAction(models.Model):
 
         """
         for review_stage in [REVIEW_TYPES, POST_DECISION_REVIEW_TYPES]:
-            for review_type in review_stage:
-                decider = review_type.cls(self)
-                decision = decider.needs_review()
-                if decision == review_type.cls.Status.NEEDS_REVIEW:
-                    self.flagged_type = review_type.type
-                    self.flagged_reason = decider.review_description_text()
-                    break
-                if decision == review_type.cls.Status.NO_REVIEW_NEEDED:
-                    self.flagged_type = ""
-                    self.flagged_reason = ""
-                    break
+            review_type, decider, decision = evaluate_review_types(
+                self, review_stage
+            )
+            if decision == BaseReviewRequiredDecider.Status.NEEDS_REVIEW:
+                self.flagged_type = review_type.type
+                self.flagged_reason = decider.review_description_text()
+            elif decision == BaseReviewRequiredDecider.Status.NO_REVIEW_NEEDED:
+                self.flagged_type = ""
+                self.flagged_reason = ""
 
     def save(self, **kwargs):
         has_initial_pk = self.pk
@@ -252,6 +252,20 @@ class Ballot(EEModifiedMixin, models.Model):
 
     objects = BallotQueryset.as_manager()
 
+    class Meta(EEModifiedMixin.Meta):
+        indexes = [
+            # The SOPN and bulk-add views repeatedly join unlocked
+            # ballots against current elections; a partial index over
+            # the unlocked rows keeps that join off the full table.
+            # The current flag lives on Election, so the condition can
+            # only cover the Ballot side of the filter.
+            models.Index(
+                fields=["election"],
+                condition=models.Q(candidates_locked=False),
+                name="ballot_unlocked_election_idx",
+            )
+        ]
+
     def __str__(self):
         fmt = "<Ballot ballot_paper_id='{e}'{locked}{w}>"
         return fmt.format(
@@ -325,10 +339,13 @@ class Ballot(EEModifiedMixin, models.Model):
 
         self.delete()
 
+    CANCELLED_STATUS_TEXT = "(❌ cancelled)"
+    LOCKED_STATUS_TEXT = mark_safe("🔐")
+
     @property
     def cancelled_status_text(self):
         if self.cancelled:
-            return "(❌ cancelled)"
+            return self.CANCELLED_STATUS_TEXT
         return None
 
     @property
@@ -344,7 +361,7 @@ class Ballot(EEModifiedMixin, models.Model):
     @property
     def locked_status_text(self):
         if self.candidates_locked:
-            return mark_safe("🔐")
+            return self.LOCKED_STATUS_TEXT
         return None
 
     @property
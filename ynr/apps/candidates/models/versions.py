@@ -4,10 +4,14 @@ from datetime import datetime
 
 from candidates.models import Ballot
 from django.conf import settings
+from django.db import transaction
+from django.db.models import Prefetch
 from django.db.models.query import prefetch_related_objects
 from parties.models import Party
 from ynr_refactoring.settings import PersonIdentifierFields
 
+MERGE_RE = re.compile(r"^After merging person (\d+)")
+
 
 def get_person_as_version_data(person, new_person=False):
     """
@@ -15,20 +19,49 @@ def get_person_as_version_data(person, new_person=False):
     empty. This should reduce the number of queries needed.
     """
 
+    from popolo.models import Membership, OtherName
+
+    # Drop any prefetch cache left on the instance first:
+    # prefetch_related_objects skips lookups that are already cached, so
+    # a stale cache (e.g. dest_person during a merge, whose memberships
+    # have moved since) would otherwise be serialized as-is
+    if hasattr(person, "_prefetched_objects_cache"):
+        del person._prefetched_objects_cache
+
     # Prefetch to reduce the number of queries
     prefetch_related_objects([person], "tmp_person_identifiers")
+    if not new_person:
+        prefetch_related_objects(
+            [person],
+            Prefetch(
+                "memberships",
+                queryset=Membership.objects.select_related("ballot", "party"),
+            ),
+            Prefetch(
+                "memberships__previous_party_affiliations",
+                queryset=Party.objects.only("ec_id"),
+            ),
+            Prefetch(
+                "other_names",
+                queryset=OtherName.objects.order_by(
+                    "name", "start_date", "end_date"
+                ),
+            ),
+            "not_standing",
+        )
 
     result = {}
     result["id"] = str(person.id)
 
     # Add PersonIdentifier fields in to the global version namespace
     # TODO: move these to dict to make it easier to merge/split/revert
-    existing_identifiers = {
-        identifier.value_type: identifier.value
+    identifier_objects = {
+        identifier.value_type: identifier
         for identifier in person.tmp_person_identifiers.all()
     }
     for field in PersonIdentifierFields:
-        result[field.name] = existing_identifiers.get(field.name, "")
+        identifier = identifier_objects.get(field.name)
+        result[field.name] = identifier.value if identifier else ""
 
     for field in settings.SIMPLE_POPOLO_FIELDS:
         result[field.name] = getattr(person, field.name) or ""
@@ -36,24 +69,22 @@ def get_person_as_version_data(person, new_person=False):
     # Add legacy identifiers
     # TODO: these should use the PersonIdenfitiers model and value types,
     # but this code emulates the legacy way of adding IDs.
-    if person.get_single_identifier_of_type("theyworkforyou"):
+    twfy_identifier = identifier_objects.get("theyworkforyou")
+    if twfy_identifier:
         result["identifiers"] = []
-        new_id = person.get_single_identifier_of_type(
-            "theyworkforyou"
-        ).internal_identifier
+        new_id = twfy_identifier.internal_identifier
         if "publicwhip" not in new_id:
             new_id = "uk.org.publicwhip/person/{}".format(new_id)
 
         result["identifiers"].append(
             {"identifier": new_id, "scheme": "uk.org.publicwhip"}
         )
-    if person.get_single_identifier_of_type("twitter_username"):
+    twitter_identifier = identifier_objects.get("twitter_username")
+    if twitter_identifier:
         result["identifiers"] = result.get("identifiers", [])
         result["identifiers"].append(
             {
-                "identifier": person.get_single_identifier_of_type(
-                    "twitter_username"
-                ).internal_identifier,
+                "identifier": twitter_identifier.internal_identifier,
                 "scheme": "twitter",
             }
         )
@@ -70,9 +101,7 @@ def get_person_as_version_data(person, new_person=False):
                 "start_date": on.start_date,
                 "end_date": on.end_date,
             }
-            for on in person.other_names.order_by(
-                "name", "start_date", "end_date"
-            )
+            for on in person.other_names.all()
         ]
 
         for membership in person.memberships.all():
@@ -85,9 +114,10 @@ def get_person_as_version_data(person, new_person=False):
                     "party_list_position"
                 ] = membership.party_list_position
             if ballot.is_welsh_run:
-                ec_ids = membership.previous_party_affiliations.values_list(
-                    "ec_id", flat=True
-                )
+                ec_ids = [
+                    party.ec_id
+                    for party in membership.previous_party_affiliations.all()
+                ]
                 candidacy["previous_party_affiliations"] = ", ".join(
                     ec_ids
                 ).strip()
@@ -113,11 +143,17 @@ def get_person_as_version_data(person, new_person=False):
     return result
 
 
+@transaction.atomic
 def revert_person_from_version_data(person, version_data):
     from candidates.models import raise_if_unsafe_to_delete
     from elections.models import Election
     from popolo.models import Membership
 
+    # Lock the person's row so concurrent reverts of the same person
+    # can't interleave their deletes and creates; everything below
+    # commits (or rolls back) as a single transaction.
+    person.__class__.objects.select_for_update().get(pk=person.pk)
+
     for field in settings.SIMPLE_POPOLO_FIELDS:
         new_value = version_data.get(field.name)
         if new_value:
@@ -136,30 +172,43 @@ def revert_person_from_version_data(person, version_data):
         person=person
     ).editable_value_types().delete()
 
-    # Add PersonIdentifier objects we want back again
+    # Add PersonIdentifier objects we want back again. The editable value
+    # types were all deleted above, so these can be created in one batch.
     # TODO: https://github.com/DemocracyClub/yournextrepresentative/issues/697
+    new_identifiers = []
     for field in PersonIdentifierFields:
         new_value = version_data.get(field.name, "")
         if new_value:
-            PersonIdentifier.objects.update_or_create(
-                person=person, value=new_value, value_type=field.name
+            new_identifiers.append(
+                PersonIdentifier(
+                    person=person, value=new_value, value_type=field.name
+                )
             )
+    PersonIdentifier.objects.bulk_create(new_identifiers)
 
     # Remove all other names, and recreate:
+    from popolo.models import OtherName
+
     person.other_names.all().delete()
-    for on in version_data.get("other_names", []):
-        person.other_names.create(
-            name=on["name"],
-            note=on.get("note", ""),
-            start_date=on.get("start_date"),
-            end_date=on.get("end_date"),
-        )
+    OtherName.objects.bulk_create(
+        [
+            OtherName(
+                content_object=person,
+                name=on["name"],
+                note=on.get("note", ""),
+                start_date=on.get("start_date"),
+                end_date=on.get("end_date"),
+            )
+            for on in version_data.get("other_names", [])
+        ]
+    )
 
     # Remove all candidacies, and recreate:
     qs = (
         Membership.objects.filter(person=person)
         .filter(result=None)
         .filter(ballot__candidates_locked=False)
+        .select_related("ballot")
     )
     for membership in qs:
         # clear the previous party affiliations if they exist
@@ -170,10 +219,33 @@ def revert_person_from_version_data(person, version_data):
     # Also remove the indications of elections that this person is
     # known not to be standing in:
     person.not_standing.clear()
-    for ballot_paper_id, candidacy in version_data["candidacies"].items():
-        ballot = Ballot.objects.get(ballot_paper_id=ballot_paper_id)
+    candidacies = version_data["candidacies"]
+    # Fetch all the ballots and parties these candidacies need in two
+    # IN queries, rather than a pair of queries per candidacy:
+    ballots_by_paper_id = {
+        ballot.ballot_paper_id: ballot
+        for ballot in Ballot.objects.filter(
+            ballot_paper_id__in=candidacies.keys()
+        ).select_related("post")
+    }
+    party_ec_ids = {candidacy["party"] for candidacy in candidacies.values()}
+    for candidacy in candidacies.values():
+        if candidacy.get("previous_party_affiliations"):
+            party_ec_ids.update(
+                candidacy["previous_party_affiliations"].split(", ")
+            )
+    parties_by_ec_id = {
+        party.ec_id: party
+        for party in Party.objects.filter(ec_id__in=party_ec_ids)
+    }
+    for ballot_paper_id, candidacy in candidacies.items():
+        ballot = ballots_by_paper_id.get(ballot_paper_id)
+        if ballot is None:
+            raise Ballot.DoesNotExist("Ballot matching query does not exist.")
         # Get the corresponding party membership data:
-        party = Party.objects.get(ec_id=candidacy["party"])
+        party = parties_by_ec_id.get(candidacy["party"])
+        if party is None:
+            raise Party.DoesNotExist("Party matching query does not exist.")
         membership, _ = Membership.objects.update_or_create(
             person=person,
             ballot=ballot,
@@ -186,9 +258,12 @@ def revert_person_from_version_data(person, version_data):
         )
         if candidacy.get("previous_party_affiliations"):
             ec_ids = candidacy["previous_party_affiliations"].split(", ")
-            parties = Party.objects.filter(ec_id__in=ec_ids)
-            for party in parties:
-                membership.previous_party_affiliations.add(party)
+            parties = [
+                parties_by_ec_id[ec_id]
+                for ec_id in ec_ids
+                if ec_id in parties_by_ec_id
+            ]
+            membership.previous_party_affiliations.add(*parties)
 
     for election_slug in version_data.get("not_standing", []):
         election = Election.objects.get(slug=election_slug)
@@ -198,11 +273,16 @@ def revert_person_from_version_data(person, version_data):
 
 
 def version_timestamp_key(version):
-    return datetime.strptime(version["timestamp"], "%Y-%m-%dT%H:%M:%S.%f")
+    # fromisoformat is much faster than strptime and understands the
+    # format we store; keep strptime as a fallback just in case.
+    try:
+        return datetime.fromisoformat(version["timestamp"])
+    except ValueError:
+        return datetime.strptime(version["timestamp"], "%Y-%m-%dT%H:%M:%S.%f")
 
 
 def is_a_merge(version):
-    m = re.search(r"^After merging person (\d+)", version["information_source"])
+    m = MERGE_RE.search(version["information_source"])
     if m:
         return m.group(1)
     return None
@@ -218,6 +298,7 @@ def get_versions_parent_map(versions_data):
     # Divide all the version with the same ID into separate ordered
     # lists, and record the parent of each version that we get from
     # doing that:
+    possible_merges = []
     for version in ordered_versions:
         version_id = version["version_id"]
         person_id = version["data"]["id"]
@@ -228,6 +309,12 @@ def get_versions_parent_map(versions_data):
         else:
             version_id_to_parent_ids[version_id] = []
         versions_for_person_id.append(version)
+        # Record any version that looks like a merge now, but only
+        # resolve it once every version has been seen, so that the
+        # merged-from person's full history is available.
+        merged_from = is_a_merge(version)
+        if merged_from is not None:
+            possible_merges.append((version_id, merged_from))
     # Now go through looking for versions that represent merges. Note
     # that it's *possible* for someone to create a new version that
     # doesn't represent a merge but which has a information_source
@@ -239,11 +326,7 @@ def get_versions_parent_map(versions_data):
     # an exception in either of these situations.
     number_of_person_ids = len(person_id_to_ordered_versions.keys())
     number_of_merges = 0
-    for version in ordered_versions:
-        version_id = version["version_id"]
-        merged_from = is_a_merge(version)
-        if merged_from is None:
-            continue
+    for version_id, merged_from in possible_merges:
         if merged_from not in person_id_to_ordered_versions:
             # This can happen because for some time there was a bug
             # where the history of the secondary person wasn't
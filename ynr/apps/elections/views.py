@@ -350,35 +350,54 @@ class BallotsForSelectAjaxView(View):
     @method_decorator(cache_page(60))
     @method_decorator(cache_control(max_age=60))
     def get(self, request, *args, **kwargs):
+        # Use values() rather than materializing a Ballot (and joined
+        # Election/Post) instance per row: the loop only reads a handful
+        # of columns
         qs = (
             Ballot.objects.filter(election__current=True)
-            .select_related("election", "post")
             .order_by(
                 "election__election_date", "election__name", "post__label"
             )
+            .values_list(
+                "ballot_paper_id",
+                "cancelled",
+                "candidates_locked",
+                "post__label",
+                "post__party_set_id",
+                "election__name",
+                "election__party_lists_in_use",
+            )
         )
         partyset_ids = dict(PartySet.objects.values_list("pk", "slug"))
         data = []
         election_name = None
-        for ballot in qs:
-            partyset_slug = partyset_ids[ballot.post.party_set_id].upper()
-            if ballot.election.name != election_name:
-                election_name = ballot.election.name
+        for (
+            ballot_paper_id,
+            cancelled,
+            candidates_locked,
+            post_label,
+            party_set_id,
+            name,
+            party_lists_in_use,
+        ) in qs:
+            partyset_slug = partyset_ids[party_set_id].upper()
+            if name != election_name:
+                election_name = name
                 if data:
                     data.append("</optgroup>")
                 data.append(f"<optgroup label='{election_name}'>")
 
             option_attrs = {
-                "value": ballot.ballot_paper_id,
+                "value": ballot_paper_id,
                 "data-party-register": partyset_slug,
-                "data-uses-party-lists": ballot.election.party_lists_in_use,
+                "data-uses-party-lists": party_lists_in_use,
             }
 
-            ballot_label = ballot.post.label
-            if ballot.cancelled:
-                ballot_label = f"{ballot_label} {ballot.cancelled_status_text}"
-            if ballot.candidates_locked:
-                ballot_label = f"{ballot_label} {ballot.locked_status_text}"
+            ballot_label = post_label
+            if cancelled:
+                ballot_label = f"{ballot_label} {Ballot.CANCELLED_STATUS_TEXT}"
+            if candidates_locked:
+                ballot_label = f"{ballot_label} {Ballot.LOCKED_STATUS_TEXT}"
                 option_attrs["disabled"] = True
 
             attrs_str = " ".join(
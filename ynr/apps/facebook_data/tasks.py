@@ -133,6 +133,18 @@ class FacebookPageIDExtractor:
         return None
 
 
+@shared_task
+def extract_fb_page_ids(identifier_pks):
+    """
+    Fan a batch of identifiers out to extract_fb_page_id. Callers saving
+    several identifiers at once (e.g. a formset) submit one broker
+    message here and the worker enqueues the rate-limited per-identifier
+    tasks.
+    """
+    for identifier_pk in identifier_pks:
+        extract_fb_page_id.delay(identifier_pk)
+
+
 @shared_task(rate_limit="4/m")
 def extract_fb_page_id(idetifier_pk):
     if settings.RUNNING_TESTS:
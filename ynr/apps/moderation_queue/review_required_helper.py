@@ -4,12 +4,44 @@ from datetime import datetime, timedelta
 from enum import Enum, unique
 
 from django.conf import settings
+from django.contrib.auth.models import Group, User
+from django.db.models import Count, Exists, OuterRef
 
 # How many previously approved edits of a type are ok before we stop flagging?
 from moderation_queue.models import VERY_TRUSTED_USER_GROUP_NAME
 
 PREVIOUSLY_APPROVED_COUNT = 20
 
+# Usernames whose edits never need a review, resolved once at import time
+# as the bot decider runs for every LoggedAction.
+BOT_USERNAMES = frozenset(
+    (
+        settings.TWITTER_BOT_USERNAME,
+        settings.CANDIDATE_BOT_USERNAME,
+        settings.RESULTS_BOT_USERNAME,
+    )
+)
+
+# Review thresholds, also bound at import time: Django's lazy settings
+# pay an attribute-resolution cost on every access and these deciders run
+# for every edit.
+FIRST_EDITS = settings.NEEDS_REVIEW_FIRST_EDITS
+MAX_REVERTS = settings.NEEDS_REVIEW_MAX_REVERTS
+LAST_24_HOURS = settings.LAST_24_HOURS
+
+
+def parent_diff_for_action(logged_action):
+    """
+    Return the parent diff ops for the version this LoggedAction created,
+    or an empty list if it can't be found. Relies on Person.version_diffs
+    being cached on the instance, so deciders sharing a LoggedAction only
+    compute the diffs once.
+    """
+    for version_diff in logged_action.person.version_diffs:
+        if version_diff["version_id"] == logged_action.popit_person_new_version:
+            return version_diff["diffs"][0]["parent_diff"]
+    return []
+
 
 class BaseReviewRequiredDecider(metaclass=abc.ABCMeta):
     """
@@ -23,11 +55,56 @@ class BaseReviewRequiredDecider(metaclass=abc.ABCMeta):
         NEEDS_REVIEW = 1
         NO_REVIEW_NEEDED = 2
 
-    def __init__(self, logged_action):
+    def __init__(self, logged_action, context=None):
         """
         :type logged_action: candidates.models.LoggedAction
+        :param context: an optional dict as returned by `bulk_evaluate`,
+            containing precomputed per-user data. When present, deciders
+            read from it instead of running their own queries.
         """
         self.logged_action = logged_action
+        self.context = context or {}
+
+    @classmethod
+    def bulk_evaluate(cls, actions):
+        """
+        Build a shared context dict for a batch of LoggedActions, running
+        each per-user decider query once for the whole batch rather than
+        once per action. Pass the result as `context` when constructing
+        deciders for any action in the batch.
+        """
+        from candidates.models import LoggedAction
+
+        user_ids = {action.user_id for action in actions if action.user_id}
+        context = {
+            "user_edit_counts": {},
+            "trusted_user_ids": set(),
+            "approved_edit_counts": {},
+        }
+        users = User.objects.filter(pk__in=user_ids).annotate(
+            edit_count=Count("loggedaction"),
+            is_trusted=Exists(
+                Group.objects.filter(
+                    user=OuterRef("pk"),
+                    name__in=[VERY_TRUSTED_USER_GROUP_NAME],
+                )
+            ),
+        )
+        for user in users:
+            context["user_edit_counts"][user.pk] = user.edit_count
+            if user.is_trusted:
+                context["trusted_user_ids"].add(user.pk)
+        approved_counts = (
+            LoggedAction.objects.filter(user_id__in=user_ids)
+            .exclude(approved=None)
+            .values("user_id", "flagged_type")
+            .annotate(count=Count("pk"))
+        )
+        for row in approved_counts:
+            context["approved_edit_counts"][
+                (row["user_id"], row["flagged_type"])
+            ] = row["count"]
+        return context
 
     @abc.abstractmethod
     def review_description_text(self):
@@ -49,20 +126,30 @@ class BaseReviewRequiredDecider(metaclass=abc.ABCMeta):
 class FirstByUserEditsDecider(BaseReviewRequiredDecider):
     """
     An edit needs review if its one of the first edits by that user,
-    as defined by settings.NEEDS_REVIEW_FIRST_EDITS
+    as defined by FIRST_EDITS
 
     """
 
     def review_description_text(self):
         return "One of the first {n} edits of user {username}".format(
             username=self.logged_action.user.username,
-            n=settings.NEEDS_REVIEW_FIRST_EDITS,
+            n=FIRST_EDITS,
         )
 
     def needs_review(self):
-        if self.logged_action.user:
-            user_edits = self.logged_action.user.loggedaction_set.count()
-            if user_edits < settings.NEEDS_REVIEW_FIRST_EDITS:
+        user = self.logged_action.user
+        if user:
+            user_edits = self.context.get("user_edit_counts", {}).get(user.pk)
+            if user_edits is None:
+                # We only care whether the user has made fewer edits than
+                # the threshold, so don't COUNT the whole table: stop
+                # reading after threshold rows.
+                user_edits = len(
+                    user.loggedaction_set.values_list("pk", flat=True)[
+                        :FIRST_EDITS
+                    ]
+                )
+            if user_edits < FIRST_EDITS:
                 return self.Status.NEEDS_REVIEW
         return self.Status.UNDECIDED
 
@@ -109,15 +196,12 @@ class CandidateStatementEditDecider(BaseReviewRequiredDecider):
         return "Edit of a statement to voters"
 
     def needs_review(self):
-        if self.logged_action.person:
-            la = self.logged_action
-            for version_diff in la.person.version_diffs:
-                if version_diff["version_id"] == la.popit_person_new_version:
-                    this_diff = version_diff["diffs"][0]["parent_diff"]
-                    for op in this_diff:
-                        if op["path"] == "biography":
-                            # this is an edit to a biography / statement
-                            return self.Status.NEEDS_REVIEW
+        # Is this an edit to a biography / statement?
+        if self.logged_action.person and any(
+            op["path"] == "biography"
+            for op in parent_diff_for_action(self.logged_action)
+        ):
+            return self.Status.NEEDS_REVIEW
         return self.Status.UNDECIDED
 
 
@@ -135,12 +219,32 @@ class PreviouslyApprovedEditsOfTypeDecider(BaseReviewRequiredDecider):
         if not self.logged_action.user:
             return self.Status.UNDECIDED
 
+        approved_edit_counts = self.context.get("approved_edit_counts")
+        if approved_edit_counts is not None:
+            previously_approved = approved_edit_counts.get(
+                (
+                    self.logged_action.user_id,
+                    self.logged_action.flagged_type,
+                ),
+                0,
+            )
+            if previously_approved >= PREVIOUSLY_APPROVED_COUNT:
+                return self.Status.NO_REVIEW_NEEDED
+            return self.Status.UNDECIDED
+
         previous_approved_of_type = self.logged_action.__class__.objects.filter(
             user=self.logged_action.user,
             flagged_type=self.logged_action.flagged_type,
         ).exclude(approved=None)
 
-        if previous_approved_of_type.count() >= PREVIOUSLY_APPROVED_COUNT:
+        # A LIMITed fetch is enough to check the threshold; avoids a full
+        # COUNT over the user's approved edits.
+        previously_approved = len(
+            previous_approved_of_type.values_list("pk", flat=True)[
+                :PREVIOUSLY_APPROVED_COUNT
+            ]
+        )
+        if previously_approved >= PREVIOUSLY_APPROVED_COUNT:
             return self.Status.NO_REVIEW_NEEDED
 
         return self.Status.UNDECIDED
@@ -155,14 +259,9 @@ class EditMadeByBotDecider(BaseReviewRequiredDecider):
         return "Edit made by bot"
 
     def needs_review(self):
-        BOT_USERS = (
-            settings.TWITTER_BOT_USERNAME,
-            settings.CANDIDATE_BOT_USERNAME,
-            settings.RESULTS_BOT_USERNAME,
-        )
         if (
             self.logged_action.user
-            and self.logged_action.user.username in BOT_USERS
+            and self.logged_action.user.username in BOT_USERNAMES
         ):
             return self.Status.NO_REVIEW_NEEDED
         return self.Status.UNDECIDED
@@ -177,12 +276,19 @@ class EditMadeByTrustedUserDecider(BaseReviewRequiredDecider):
         return "Edit made by very trusted user"
 
     def needs_review(self):
-        if not self.logged_action.user:
+        user = self.logged_action.user
+        if not user:
+            return self.Status.UNDECIDED
+
+        trusted_user_ids = self.context.get("trusted_user_ids")
+        if trusted_user_ids is not None:
+            if user.pk in trusted_user_ids:
+                return self.Status.NO_REVIEW_NEEDED
             return self.Status.UNDECIDED
 
         trusted_permissions = [VERY_TRUSTED_USER_GROUP_NAME]
 
-        qs = self.logged_action.user.groups.filter(name__in=trusted_permissions)
+        qs = user.groups.filter(name__in=trusted_permissions)
         if qs.exists():
             return self.Status.NO_REVIEW_NEEDED
         return self.Status.UNDECIDED
@@ -202,18 +308,13 @@ class CandidateCurrentNameDecider(BaseReviewRequiredDecider):
             qs = la.person.memberships.filter(
                 ballot__election__current=True, ballot__candidates_locked=True
             )
-            if qs.exists():
-                # This person is standing in a current election
-                for version_diff in la.person.version_diffs:
-                    if (
-                        version_diff["version_id"]
-                        == la.popit_person_new_version
-                    ):
-                        this_diff = version_diff["diffs"][0]["parent_diff"]
-                        for op in this_diff:
-                            if op["path"] == "name" and op["op"] == "replace":
-                                # this is an edit to a name
-                                return self.Status.NEEDS_REVIEW
+            # This person is standing in a current election; is this
+            # an edit to their name?
+            if qs.exists() and any(
+                op["path"] == "name" and op["op"] == "replace"
+                for op in parent_diff_for_action(la)
+            ):
+                return self.Status.NEEDS_REVIEW
             return self.Status.UNDECIDED
         return None
 
@@ -230,10 +331,15 @@ class RevertedEdits(BaseReviewRequiredDecider):
             recent_revert_qs = LoggedAction.objects.filter(
                 person=self.logged_action.person,
                 action_type=ActionType.PERSON_REVERT,
-                # updated in the last 24 hours
-                updated__gt=datetime.now() - timedelta(settings.LAST_24_HOURS),
-            ).order_by("updated")
-            if recent_revert_qs.count() >= settings.NEEDS_REVIEW_MAX_REVERTS:
+                # updated in the last 24 hours. LAST_24_HOURS is a number
+                # of hours; passing it to timedelta positionally treated
+                # it as days.
+                updated__gt=datetime.now() - timedelta(hours=LAST_24_HOURS),
+            )
+            recent_reverts = len(
+                recent_revert_qs.values_list("pk", flat=True)[:MAX_REVERTS]
+            )
+            if recent_reverts >= MAX_REVERTS:
                 return self.Status.NEEDS_REVIEW
             return self.Status.UNDECIDED
         return None
@@ -258,16 +364,18 @@ REVIEW_TYPES = (
         label="Type of edit that never needs a review",
         cls=EditTypesThatNeverNeedReview,
     ),
-    ReviewType(
-        type="no_review_needed_due_to_user_being_very_trusted",
-        label="Edit made by very trusted user",
-        cls=EditMadeByTrustedUserDecider,
-    ),
+    # The bot check is constant time, so run it before any decider that
+    # has to hit the database.
     ReviewType(
         type="no_review_needed_due_to_user_being_a_bot",
         label="Edit made by bot",
         cls=EditMadeByBotDecider,
     ),
+    ReviewType(
+        type="no_review_needed_due_to_user_being_very_trusted",
+        label="Edit made by very trusted user",
+        cls=EditMadeByTrustedUserDecider,
+    ),
     ReviewType(
         type="needs_review_due_to_high_profile",
         label="Edit of a candidate whose record may be particularly liable to vandalism",
@@ -307,3 +415,37 @@ POST_DECISION_REVIEW_TYPES = (
         cls=PreviouslyApprovedEditsOfTypeDecider,
     ),
 )
+
+# O(1) lookups for consumers that resolve a ReviewType from its type key
+# or label rather than scanning the tuples
+REVIEW_TYPES_BY_TYPE = {
+    rt.type: rt for rt in REVIEW_TYPES + POST_DECISION_REVIEW_TYPES
+}
+REVIEW_TYPES_BY_LABEL = {
+    rt.label: rt for rt in REVIEW_TYPES + POST_DECISION_REVIEW_TYPES
+}
+
+
+def get_review_type(type_key):
+    """
+    Return the ReviewType with the given type key, or None
+    """
+    return REVIEW_TYPES_BY_TYPE.get(type_key)
+
+
+def evaluate_review_types(logged_action, review_types, context=None):
+    """
+    Run the deciders in `review_types` in order, stopping at the first
+    terminal decision so later deciders don't run their queries for
+    nothing. Returns a (ReviewType, decider, Status) triple; the first
+    two are None if every decider was undecided.
+    """
+    for review_type in review_types:
+        decider = review_type.cls(logged_action, context=context)
+        decision = decider.needs_review()
+        if decision in (
+            BaseReviewRequiredDecider.Status.NEEDS_REVIEW,
+            BaseReviewRequiredDecider.Status.NO_REVIEW_NEEDED,
+        ):
+            return review_type, decider, decision
+    return None, None, BaseReviewRequiredDecider.Status.UNDECIDED
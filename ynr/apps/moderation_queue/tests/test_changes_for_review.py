@@ -14,7 +14,13 @@ from django.utils.timezone import make_aware
 from django_webtest import WebTest
 from lxml import etree
 from mock import patch
-from moderation_queue.review_required_helper import PREVIOUSLY_APPROVED_COUNT
+from moderation_queue.review_required_helper import (
+    POST_DECISION_REVIEW_TYPES,
+    PREVIOUSLY_APPROVED_COUNT,
+    REVIEW_TYPES,
+    BaseReviewRequiredDecider,
+    evaluate_review_types,
+)
 from parties.models import Party
 from people.models import Person
 from people.tests.test_version_diffs import tidy_html_whitespace
@@ -302,6 +308,77 @@ class TestFlaggedEdits(UK2015ExamplesMixin, TestUserMixin, WebTest):
         self.assertEqual(last_revert.action_type, "person-revert")
         self.assertIn(last_revert, las.needs_review())
 
+    def test_old_reverts_dont_need_review(self):
+        """
+        Reverts older than 24 hours shouldn't count towards the revert
+        limit. Regression test: the window used to be 24 *days* because
+        LAST_24_HOURS was passed to timedelta positionally
+        """
+        example_person = people.tests.factories.PersonFactory.create(
+            id=4758, name="Phil Hutty"
+        )
+
+        # update person 3x to create a user history
+        self.update_person(example_person)
+
+        # Two reverts three days ago: outside the 24 hour window, but
+        # well inside the old 24 day one
+        three_days_ago = make_aware(datetime.now() - timedelta(days=3))
+        for i in range(2):
+            la = LoggedAction.objects.create(
+                id=(1700 + i),
+                user=self.user,
+                action_type=ActionType.PERSON_REVERT,
+                person=example_person,
+                popit_person_new_version=random_person_id(),
+                source="Just for tests...",
+            )
+            change_updated_and_created(la, three_days_ago)
+
+        fresh_revert = LoggedAction.objects.create(
+            id=1702,
+            user=self.user,
+            action_type=ActionType.PERSON_REVERT,
+            person=example_person,
+            popit_person_new_version=random_person_id(),
+            source="Just for tests...",
+        )
+        self.assertNotIn(fresh_revert, LoggedAction.objects.needs_review())
+
+    def test_bulk_evaluate_context_matches_per_action_queries(self):
+        """
+        Deciders given a bulk_evaluate context must reach the same
+        decisions as when they run their own per-action queries
+        """
+        example_person = people.tests.factories.PersonFactory.create(
+            id=4759, name="Phil Hutty"
+        )
+        self.update_person(example_person)
+        for i, user in enumerate([self.user, self.very_trusted_user]):
+            LoggedAction.objects.create(
+                id=(1800 + i),
+                user=user,
+                action_type=ActionType.PERSON_UPDATE,
+                person=example_person,
+                popit_person_new_version=random_person_id(),
+                source="Just for tests...",
+            )
+
+        actions = list(LoggedAction.objects.all())
+        context = BaseReviewRequiredDecider.bulk_evaluate(actions)
+        for action in actions:
+            for review_stage in [REVIEW_TYPES, POST_DECISION_REVIEW_TYPES]:
+                review_type, _, decision = evaluate_review_types(
+                    action, review_stage
+                )
+                (
+                    context_review_type,
+                    _,
+                    context_decision,
+                ) = evaluate_review_types(action, review_stage, context=context)
+                self.assertEqual(decision, context_decision)
+                self.assertEqual(review_type, context_review_type)
+
 
 @patch.object(Person, "diff_for_version", fake_diff_html)
 @patch("candidates.models.db.datetime")
@@ -101,17 +101,13 @@ class TestModels(TestUserMixin, WebTest):
             form["uploaded_file"] = Upload("pilot.pdf", f.read())
 
         with patch(
-            "official_documents.views.extract_pages_for_ballot"
-        ) as extract_pages, patch(
-            "official_documents.views.extract_ballot_table"
-        ) as extract_tables, patch(
-            "official_documents.views.parse_raw_data_for_ballot"
-        ) as parse_tables:
+            "official_documents.views.extract_and_parse_tables_for_ballot"
+        ) as extract_and_parse:
             response = form.submit()
             self.assertEqual(response.status_code, 302)
-            extract_pages.assert_called_once()
-            extract_tables.assert_called_once()
-            parse_tables.assert_called_once()
+            extract_and_parse.delay.assert_called_once_with(
+                self.ballot.ballot_paper_id
+            )
 
         ods = OfficialDocument.objects.all()
         self.assertEqual(ods.count(), 1)
@@ -2,15 +2,14 @@ from auth_helpers.views import GroupRequiredMixin
 from candidates.models import Ballot, LoggedAction
 from candidates.models.db import ActionType
 from candidates.views.version_data import get_client_ip
+from django.db.models import Exists, OuterRef
 from django.http.response import HttpResponseRedirect
 from django.shortcuts import get_object_or_404
 from django.template.loader import render_to_string
+from django.utils.functional import cached_property
 from django.views.generic import CreateView, DetailView, TemplateView
 from moderation_queue.models import SuggestedPostLock
-from sopn_parsing.helpers.extract_pages import extract_pages_for_ballot
-from sopn_parsing.helpers.extract_tables import extract_ballot_table
-from sopn_parsing.helpers.parse_tables import parse_raw_data_for_ballot
-from sopn_parsing.helpers.text_helpers import NoTextInDocumentError
+from sopn_parsing.tasks import extract_and_parse_tables_for_ballot
 
 from .forms import UploadDocumentForm
 from .models import DOCUMENT_UPLOADERS_GROUP_NAME, OfficialDocument
@@ -22,40 +21,38 @@ class CreateDocumentView(GroupRequiredMixin, CreateView):
     form_class = UploadDocumentForm
     template_name = "official_documents/upload_document_form.html"
 
+    @cached_property
+    def ballot(self):
+        return get_object_or_404(
+            Ballot.objects.select_related("post", "election"),
+            ballot_paper_id=self.kwargs["ballot_paper_id"],
+        )
+
     def get_initial(self):
         return {
-            "ballot": Ballot.objects.get(
-                ballot_paper_id=self.kwargs["ballot_paper_id"]
-            ),
+            "ballot": self.ballot,
             "document_type": OfficialDocument.NOMINATION_PAPER,
         }
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        ballot = get_object_or_404(
-            Ballot, ballot_paper_id=self.kwargs["ballot_paper_id"]
-        )
-        context["post_label"] = ballot.post.label
+        context["post_label"] = self.ballot.post.label
         return context
 
     def form_valid(self, form):
         """
-        Saves the SOPN and attempts to parse the PDF to extract the candidate
-        information. This fails silently to avoid a 500 error if the PDF cannot
-        be parsed. We always save the file even if it cannot be parsed, then
-        create a LoggedAction and redirect the user.
+        Saves the SOPN and hands the PDF over to the parsing task. Parsing
+        happens off the web thread, so a document that takes minutes to
+        parse (or can't be parsed at all) doesn't block or break the
+        upload. We always save the file, then create a LoggedAction and
+        redirect the user.
         """
         self.object = form.save()
-        try:
-            if hasattr(self.object.ballot, "rawpeople"):
-                self.object.ballot.rawpeople.delete()
-            extract_pages_for_ballot(ballot=self.object.ballot)
-            extract_ballot_table(ballot=self.object.ballot)
-            parse_raw_data_for_ballot(ballot=self.object.ballot)
-        except (ValueError, NoTextInDocumentError):
-            # If PDF couldnt be parsed continue
-            # TODO should be log this error?
-            pass
+        if hasattr(self.object.ballot, "rawpeople"):
+            self.object.ballot.rawpeople.delete()
+        extract_and_parse_tables_for_ballot.delay(
+            self.object.ballot.ballot_paper_id
+        )
 
         LoggedAction.objects.create(
             user=self.request.user,
@@ -80,7 +77,14 @@ class PostsForDocumentView(DetailView):
             .filter(ballot__election=self.object.ballot.election)
             .select_related("ballot__post", "ballot__election")
             .order_by("ballot__ballot_paper_id")
-            .prefetch_related("ballot__suggestedpostlock_set")
+            # The template only needs to know whether a lock has been
+            # suggested, so annotate that instead of shipping every lock
+            # row back
+            .annotate(
+                has_lock=Exists(
+                    SuggestedPostLock.objects.filter(ballot=OuterRef("ballot"))
+                )
+            )
         )
 
         context["document_posts"] = documents
@@ -101,18 +105,19 @@ class UnlockedWithDocumentsView(TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
 
-        SOPNs_qs = OfficialDocument.objects.filter(
-            ballot__election__current=True
-        ).select_related("ballot__election", "ballot__post")
-
-        SOPNs_qs = SOPNs_qs.exclude(
-            ballot__post__in=SuggestedPostLock.objects.all().values(
-                "ballot__post"
-            )
+        # An Exists() anti-join plans much better than the previous
+        # NOT IN subquery over every suggested lock
+        locked_posts = SuggestedPostLock.objects.filter(
+            ballot__post=OuterRef("ballot__post")
         )
-
-        context["unlocked_sopns"] = SOPNs_qs.filter(
-            ballot__candidates_locked=False
+        context["unlocked_sopns"] = (
+            OfficialDocument.objects.annotate(has_lock=Exists(locked_posts))
+            .filter(
+                ballot__election__current=True,
+                ballot__candidates_locked=False,
+                has_lock=False,
+            )
+            .select_related("ballot__election", "ballot__post")
         )
 
         return context
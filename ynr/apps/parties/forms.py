@@ -5,11 +5,13 @@ from people.forms.fields import BallotInputWidget
 from utils.widgets import SelectWithAttrs
 
 
-def party_and_description_dict_from_string(value):
+def party_and_description_dict_from_string(value, party=None):
     """
     Given an input string in the form of "party" or "party__description"
     return a dict containing party and description name, id and objects
 
+    Pass `party` if the Party has already been looked up to save
+    re-running the query.
     """
     if not value:
         return value
@@ -19,7 +21,8 @@ def party_and_description_dict_from_string(value):
         party_id = value
         description_id = None
     try:
-        party = Party.objects.current().get(ec_id__iexact=party_id.strip())
+        if party is None:
+            party = Party.objects.current().get(ec_id__iexact=party_id.strip())
         ret = {
             "party_obj": party,
             "party_id": party.ec_id,
@@ -50,9 +53,11 @@ class PartyIdentifierInput(forms.CharField):
 
 
 class PartyChoiceField(forms.ChoiceField):
+    _party = None
+
     def clean(self, value):
         value = super().clean(value)
-        return party_and_description_dict_from_string(value)
+        return party_and_description_dict_from_string(value, party=self._party)
 
     def validate(self, value):
         """
@@ -61,11 +66,18 @@ class PartyChoiceField(forms.ChoiceField):
         ignore any input value for this field type. The MultiWidget will
         raise a ValidataionError if the party isn't actually found, so there's
         no problem with ignoring validation here.
+
+        Keep hold of any party we do find so clean doesn't have to look
+        it up a second time.
         """
+        party_id = value.split("__")[0] if value else value
         try:
-            Party.objects.current().get(ec_id__iexact=value.strip())
+            self._party = Party.objects.current().get(
+                ec_id__iexact=party_id.strip()
+            )
             return True
         except Party.DoesNotExist:
+            self._party = None
             return False
 
 
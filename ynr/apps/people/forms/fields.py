@@ -43,17 +43,41 @@ class ValidBallotField(forms.CharField):
 
     widget = BallotInputWidget
 
+    # The most recently resolved Ballot. Both to_python and clean can be
+    # called for the same value on a single request, so remember the
+    # result rather than running the same query again.
+    _ballot = None
+
     def prepare_value(self, value):
         if isinstance(value, Ballot):
             return value.ballot_paper_id
         return value
 
+    def _get_ballot(self, value):
+        if (
+            self._ballot
+            and self._ballot.ballot_paper_id.lower() == value.lower().strip()
+        ):
+            return self._ballot
+        self._ballot = (
+            Ballot.objects.select_related("post", "election", "post__party_set")
+            # Trim the Ballot row to the columns validation and saving
+            # actually read; naming the FKs keeps the joined rows whole
+            .only(
+                "ballot_paper_id",
+                "candidates_locked",
+                "cancelled",
+                "election",
+                "post",
+                "post__party_set",
+            ).get(ballot_paper_id__iexact=value.strip())
+        )
+        return self._ballot
+
     def to_python(self, value):
         if not value:
             return value
-        return Ballot.objects.select_related(
-            "post", "election", "post__party_set"
-        ).get(ballot_paper_id=value)
+        return self._get_ballot(value)
 
     def clean(self, value):
         if not value:
@@ -61,9 +85,8 @@ class ValidBallotField(forms.CharField):
         value = value.lower()
         if len(value.split(".")) < 3:
             raise ValidationError("Invalid ballot paper ID")
-        base_qs = Ballot.objects.all().select_related("election")
         try:
-            return base_qs.get(ballot_paper_id__iexact=value.strip())
+            return self._get_ballot(value)
         except Ballot.DoesNotExist:
             raise ValidationError("Unknown ballot paper ID")
 
@@ -105,7 +128,9 @@ class StrippedCharField(forms.CharField):
 
     def to_python(self, value):
         value = super().to_python(value)
-        if self.strip:
+        # Most submitted values have no surrounding whitespace; checking
+        # the ends first skips a per-field strip() on the hot path
+        if self.strip and value and (value[0].isspace() or value[-1].isspace()):
             value = value.strip()
         return value
 
@@ -6,8 +6,8 @@ from django import forms
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.core.validators import URLValidator, validate_email
+from django.db import transaction
 from django.utils.functional import cached_property
-from facebook_data.tasks import extract_fb_page_id
 from official_documents.models import OfficialDocument
 from parties.forms import (
     PartyIdentifierField,
@@ -147,10 +147,9 @@ class PersonIdentifierForm(forms.ModelForm):
         return email
 
     def save(self, commit=True):
-        ret = super().save(commit=commit)
-        if commit and self.cleaned_data["value_type"].startswith("facebook"):
-            extract_fb_page_id.delay(self.instance.pk)
-        return ret
+        # Facebook page ID extraction is enqueued in one batch by
+        # PersonIdentifierFormSet.save rather than per form here
+        return super().save(commit=commit)
 
 
 class PersonMembershipForm(PopulatePartiesMixin, forms.ModelForm):
@@ -390,16 +389,19 @@ class NewPersonForm(PopulatePartiesMixin, BasePersonForm):
     ballot_paper_id = CurrentUnlockedBallotsField(widget=forms.HiddenInput)
 
     def save(self, commit=True):
-        person = super().save(commit)
-        if person.pk:
-            party_data = self.cleaned_data["party_identifier"]
-            person.memberships.create(
-                ballot=self.cleaned_data["ballot_paper_id"],
-                party=party_data["party_obj"],
-                party_name=party_data["party_name"],
-                party_description=party_data["description_obj"],
-                post=self.cleaned_data["ballot_paper_id"].post,
-            )
+        # One transaction for the person and their membership rather
+        # than a commit per INSERT
+        with transaction.atomic():
+            person = super().save(commit)
+            if person.pk:
+                party_data = self.cleaned_data["party_identifier"]
+                person.memberships.create(
+                    ballot=self.cleaned_data["ballot_paper_id"],
+                    party=party_data["party_obj"],
+                    party_name=party_data["party_name"],
+                    party_description=party_data["description_obj"],
+                    post=self.cleaned_data["ballot_paper_id"].post,
+                )
         return person
 
 
@@ -429,13 +431,25 @@ class OtherNameForm(forms.ModelForm):
         max_length=512,
     )
 
+    def __init__(self, *args, existing_names=None, **kwargs):
+        """
+        Pass `existing_names` (any container of name strings) when
+        validating several of these forms for the same person, so each
+        form doesn't run its own duplicate-name query.
+        """
+        super().__init__(*args, **kwargs)
+        self.existing_names = existing_names
+
     def clean_name(self):
         name = self.cleaned_data["name"]
         if "name" not in self.changed_data:
             return name
-        name_exists = self.instance.content_object.other_names.filter(
-            name=name
-        ).exists()
+        if self.existing_names is not None:
+            name_exists = name in self.existing_names
+        else:
+            name_exists = self.instance.content_object.other_names.filter(
+                name=name
+            ).exists()
 
         if name_exists:
             raise ValidationError("This other name already exists")
@@ -448,12 +462,28 @@ class AddElectionFieldsMixin(object):
         # Generating the party choices for each party set is quite
         # slow, so cache these results, so they're not fetched from
         # the database again each time add_election_fields is called.
-        return [
-            (
-                party_set,
-                Party.objects.register(party_set.slug.upper()).party_choices(
-                    include_descriptions=False
-                ),
+        # Fetch every party once and bucket them by register in Python,
+        # rather than running one party_choices query per party set.
+        party_sets = list(PartySet.objects.all())
+        registers = {party_set.slug.upper() for party_set in party_sets}
+        choices = {register: [("", {"label": ""})] for register in registers}
+        parties = Party.objects.only(
+            "date_deregistered", "name", "ec_id", "register"
+        ).order_by("-total_candidates", "name")
+        for party in parties:
+            entry = (
+                str(party.ec_id),
+                {
+                    "label": party.format_name,
+                    "register": party.register or "all",
+                },
             )
-            for party_set in PartySet.objects.all()
+            if party.register is None:
+                for register in registers:
+                    choices[register].append(entry)
+            elif party.register in choices:
+                choices[party.register].append(entry)
+        return [
+            (party_set, choices[party_set.slug.upper()])
+            for party_set in party_sets
         ]
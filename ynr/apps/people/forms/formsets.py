@@ -1,14 +1,33 @@
 from django import forms
 from django.forms import BaseInlineFormSet
 from django.forms.formsets import DELETION_FIELD_NAME
+from facebook_data.tasks import extract_fb_page_ids
 from people.forms.forms import PersonIdentifierForm, PersonMembershipForm
 from people.models import Person, PersonIdentifier
 from popolo.models import Membership
 
+
+class PersonIdentifierFormSet(BaseInlineFormSet):
+    def save(self, commit=True):
+        identifiers = super().save(commit=commit)
+        if commit:
+            # One broker message for the whole formset rather than one
+            # per saved facebook identifier
+            facebook_pks = [
+                identifier.pk
+                for identifier in identifiers
+                if identifier.value_type.startswith("facebook")
+            ]
+            if facebook_pks:
+                extract_fb_page_ids.delay(facebook_pks)
+        return identifiers
+
+
 PersonIdentifierFormsetFactory = forms.inlineformset_factory(
     Person,
     PersonIdentifier,
     form=PersonIdentifierForm,
+    formset=PersonIdentifierFormSet,
     can_delete=True,
     widgets={
         "value_type": forms.Select(
@@ -27,9 +46,11 @@ class MembershipFormSet(BaseInlineFormSet):
 
     def get_queryset(self):
         qs = super().get_queryset()
+        # PersonMembershipForm.__init__ reads each instance's ballot and
+        # party, so join them here rather than one query per form
         return qs.filter(
             ballot__candidates_locked=False, ballot__election__current=True
-        ).select_related("ballot", "ballot__election")
+        ).select_related("ballot", "ballot__election", "party")
 
     def get_form_kwargs(self, index):
         kwargs = super().get_form_kwargs(index)
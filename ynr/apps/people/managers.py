@@ -18,11 +18,19 @@ class PersonImageManager(models.Manager):
         return person_image
 
 
+# These only depend on the PersonIdentifierFields enum, so build them
+# once at import rather than on every select_choices() /
+# editable_value_types() call.
+PERSON_IDENTIFIER_CHOICES = [(None, "")] + [
+    (f.name, f.value) for f in PersonIdentifierFields
+]
+EDITABLE_VALUE_TYPES = [vt[0] for vt in PERSON_IDENTIFIER_CHOICES]
+
+
 class PersonIdentifierQuerySet(models.query.QuerySet):
     def select_choices(self):
-        default_option = [(None, "")]
-        options = [(f.name, f.value) for f in PersonIdentifierFields]
-        return default_option + options
+        # Return a copy so callers can safely mutate the list
+        return list(PERSON_IDENTIFIER_CHOICES)
 
     def editable_value_types(self):
         """
@@ -32,9 +40,7 @@ class PersonIdentifierQuerySet(models.query.QuerySet):
         In that case, we need a way to exclude non-editable models from
         the edit form and the versions diff.
         """
-        return self.filter(
-            value_type__in=[vt[0] for vt in self.select_choices()]
-        )
+        return self.filter(value_type__in=EDITABLE_VALUE_TYPES)
 
 
 POPULATE_NAME_SEARCH_COLUMN_SQL = """
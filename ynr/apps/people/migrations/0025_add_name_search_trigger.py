@@ -3,8 +3,23 @@
 from django.db import migrations
 from people.managers import NAME_SEARCH_TRIGGER_SQL
 
+DROP_NAME_SEARCH_TRIGGER_SQL = """
+    DROP TRIGGER IF EXISTS tsvectorupdate ON people_person CASCADE;
+    DROP FUNCTION IF EXISTS people_person_search_trigger() CASCADE;
+"""
+
 
 class Migration(migrations.Migration):
+    # The trigger SQL drops and recreates the function and trigger, so it
+    # is idempotent, but run it in one transaction so a failure can't
+    # leave the function behind without its trigger
+    atomic = True
+
     dependencies = [("people", "0024_add_gist_index_for_search")]
 
-    operations = [migrations.RunSQL(NAME_SEARCH_TRIGGER_SQL)]
+    operations = [
+        migrations.RunSQL(
+            sql=NAME_SEARCH_TRIGGER_SQL,
+            reverse_sql=DROP_NAME_SEARCH_TRIGGER_SQL,
+        )
+    ]
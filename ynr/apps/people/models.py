@@ -626,8 +626,10 @@ class Person(TimeStampedModel, models.Model):
             ballot__election=election, elected=True
         ).exists()
 
-    @property
+    @cached_property
     def version_diffs(self):
+        # Computing the diffs is expensive, and several review deciders
+        # can ask for them for the same instance, so cache per-instance.
         versions = self.versions
         if not versions:
             versions = []
@@ -3,6 +3,7 @@
 from __future__ import unicode_literals
 
 from django.db import migrations
+from django.db.models import Case, IntegerField, Value, When
 
 
 def copy_org_to_party(apps, schema_editor):
@@ -31,11 +32,11 @@ def copy_org_to_party(apps, schema_editor):
     5. Iterate over all Organisations with the classification of "Party" and:
         1. Get the best ID for this party (prefer the EC ID, fall back to the
            OTHER ID or slug)
-        2. update_or_create a Party object
-        3. Store all the parties and orgs in a dict with org as the key
-    6. Iterate over the map between object types
-    7. Filter Membership objects by the organisation object ID and update it
-       with the party object.
+        2. Collect a Party row for it, then bulk_create them all at once
+        3. Store the party PK for each org PK in a dict
+    6. Build a CASE expression over the PK map
+    7. Update every Membership with its party in a single UPDATE keyed
+       on the organisation object ID.
 
     Note that this migration doesn't remove any data, just copies it in to a
     different format / model / field.
@@ -47,34 +48,42 @@ def copy_org_to_party(apps, schema_editor):
     Identifier = apps.get_model("popolo", "Identifier")
     ContentType = apps.get_model("contenttypes", "ContentType")
 
+    # for_concrete_model=False skips the concrete-model descent and
+    # shares get_for_model's per-process cache across replays
     organization_content_type_id = ContentType.objects.get_for_model(
-        Organization
+        Organization, for_concrete_model=False
     ).pk
 
-    #  Set up the maps we'll need
-    ORG_PK_TO_EC_IDS = {}
-    ORG_OBJ_TO_PARTY_OBJ = {}
-
-    # Get all the IDs used for Organizations
-    ids_qs = Identifier.objects.filter(
-        content_type_id=organization_content_type_id,
-        scheme="electoral-commission",
+    # Map each organisation to its EC ID straight from value tuples —
+    # no Identifier instances — streaming the rows rather than caching
+    # the whole queryset in memory
+    ORG_PK_TO_EC_IDS = dict(
+        Identifier.objects.filter(
+            content_type_id=organization_content_type_id,
+            scheme="electoral-commission",
+        )
+        .values_list("object_id", "identifier")
+        .iterator(chunk_size=2000)
     )
 
-    # Populate the maps with the IDs for each organisation
-    for identifier in ids_qs:
-        ORG_PK_TO_EC_IDS[identifier.object_id] = identifier.identifier
-
-    # Get all Organisations that are parties
-    all_org_parties = Organization.objects.filter(classification="Party")
+    # Get all Organisations that are parties, joining the extra row so
+    # the slug fallback below doesn't query per org
+    all_org_parties = (
+        Organization.objects.filter(classification="Party")
+        .select_related("extra")
+        .only("name", "start_date", "created_at", "extra__slug")
+    )
 
-    for org_party in all_org_parties:
+    new_parties = {}
+    org_to_party_id = {}
+    for org_party in all_org_parties.iterator(chunk_size=2000):
         # First we need an ID for this party.
         # This could take the form of an EC ID (PP01) or a psudo-party ID we've
         # assigned in the past (ynmp-party:2), or a slug (joint-party:1-2)
         # preferred in that order.
 
-        party_id = ORG_PK_TO_EC_IDS.get(org_party.pk, org_party.extra.slug)
+        # Only touch the extra row when there's no EC ID to use
+        party_id = ORG_PK_TO_EC_IDS.get(org_party.pk) or org_party.extra.slug
 
         start_date = org_party.start_date
         if not start_date:
@@ -88,27 +97,48 @@ def copy_org_to_party(apps, schema_editor):
             # when the parties importer is run first / next
             start_date = org_party.created_at
 
-        # Update or create the party, using the "EC ID" that will be used by the
-        # party importer
-        party_obj, _ = Party.objects.update_or_create(
-            ec_id=party_id,
-            defaults={"name": org_party.name, "date_registered": start_date},
-        )
-
-        # Populate the map from the org object to the party object
-        ORG_OBJ_TO_PARTY_OBJ[org_party] = party_obj
-
-    for org_party, party_obj in ORG_OBJ_TO_PARTY_OBJ.items():
-        # Update the memberships for this org
-        Membership.objects.filter(on_behalf_of_id=org_party).update(
-            party=party_obj
+        # Collect the party rows, keyed by the "EC ID" that will be used
+        # by the party importer, so they can be created in one batch
+        new_parties[party_id] = Party(
+            ec_id=party_id, name=org_party.name, date_registered=start_date
         )
+        org_to_party_id[org_party.pk] = party_id
 
-    # Just make sure no memberships are left without a Party
-    assert Membership.objects.filter(party=None).count() == 0
-
-    # These numbers should be identical
-    if Party.objects.count() < all_org_parties.count():
+    # One INSERT per batch rather than a SELECT plus an INSERT per party;
+    # ignore_conflicts leaves any party that already exists alone
+    Party.objects.bulk_create(
+        new_parties.values(), batch_size=1000, ignore_conflicts=True
+    )
+    parties_by_ec_id = {
+        party.ec_id: party
+        for party in Party.objects.filter(ec_id__in=new_parties)
+    }
+
+    # Map the org PK straight to the new party's PK; keeping the map on
+    # ints avoids hashing model instances and repeated pk descents
+    ORG_PK_TO_PARTY_PK = {
+        org_pk: parties_by_ec_id[party_id].pk
+        for org_pk, party_id in org_to_party_id.items()
+    }
+
+    # Update the memberships for every org in one UPDATE, rather than a
+    # round-trip per party
+    whens = [
+        When(on_behalf_of_id=org_pk, then=Value(party_pk))
+        for org_pk, party_pk in ORG_PK_TO_PARTY_PK.items()
+    ]
+    if whens:
+        Membership.objects.filter(
+            on_behalf_of_id__in=ORG_PK_TO_PARTY_PK
+        ).update(party_id=Case(*whens, output_field=IntegerField()))
+
+    # Just make sure no memberships are left without a Party; exists()
+    # stops at the first NULL rather than counting the whole table
+    assert not Membership.objects.filter(party=None).exists()
+
+    # These numbers should be identical; both are already known from
+    # the loops above, so no COUNT queries are needed
+    if len(parties_by_ec_id) < len(new_parties):
         raise ValueError("More Organzation parties than Parties")
 
 
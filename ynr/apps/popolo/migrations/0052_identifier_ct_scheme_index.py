@@ -0,0 +1,14 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [("popolo", "0051_alter_membership_deselected_and_more")]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="identifier",
+            index=models.Index(
+                fields=["content_type", "scheme"], name="id_ct_scheme_idx"
+            ),
+        )
+    ]
@@ -573,6 +573,16 @@ class Identifier(GenericRelatable, models.Model):
         help_text="An identifier scheme, e.g. DUNS",
     )
 
+    class Meta:
+        indexes = [
+            # Identifiers are always looked up by content type and
+            # scheme, both through the generic relation and in data
+            # migrations
+            models.Index(
+                fields=["content_type", "scheme"], name="id_ct_scheme_idx"
+            )
+        ]
+
     def __str__(self):
         return "{}: {}".format(self.scheme, self.identifier)
 
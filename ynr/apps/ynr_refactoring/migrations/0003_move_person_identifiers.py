@@ -11,20 +11,29 @@ def move_person_identifiers(apps, schema_editor):
     Person = apps.get_model("people", "Person")
     Identifier = apps.get_model("popolo", "Identifier")
 
-    person_content_type_id = ContentType.objects.get_for_model(Person).pk
+    person_content_type_id = ContentType.objects.get_for_model(
+        Person, for_concrete_model=False
+    ).pk
     qs = Identifier.objects.filter(
         content_type_id=person_content_type_id, scheme="uk.org.publicwhip"
-    )
-    for identifier in qs:
-        public_whip_id = identifier.identifier.split("/")[-1]
-        PersonIdentifier.objects.update_or_create(
+    ).only("object_id", "identifier")
+    # Build every target row up front and insert in batches, rather
+    # than a SELECT and INSERT per identifier; ignore_conflicts makes
+    # re-runs a no-op like update_or_create was
+    new_identifiers = [
+        PersonIdentifier(
             person_id=identifier.object_id,
             value="https://www.theyworkforyou.com/mp/{}/".format(
-                public_whip_id
+                identifier.identifier.split("/")[-1]
             ),
             value_type="theyworkforyou",
             internal_identifier=identifier.identifier,
         )
+        for identifier in qs.iterator(chunk_size=5000)
+    ]
+    PersonIdentifier.objects.bulk_create(
+        new_identifiers, batch_size=5000, ignore_conflicts=True
+    )
 
 
 class Migration(migrations.Migration):